@@ -1,6 +1,6 @@
 """Mappers for converting swagger analysis models to JSON-serializable dictionaries."""
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from ...tools.swagger_analysis.domain.models import (
     SwaggerAnalysisResult, EndpointInfo, FieldInfo, ResponseInfo
 )
@@ -13,6 +13,8 @@ class SwaggerMapper:
     @staticmethod
     def to_dict(result: SwaggerAnalysisResult) -> Dict[str, Any]:
         """Convert SwaggerAnalysisResult to dictionary."""
+        endpoints_by_method, endpoints_with_body, response_codes = SwaggerMapper._summary_stats(result.endpoints)
+        
         return {
             "title": result.title,
             "version": result.version,
@@ -28,9 +30,9 @@ class SwaggerMapper:
                 "description": result.description,
                 "base_urls": result.base_urls,
                 "total_endpoints": result.total_endpoints,
-                "endpoints_by_method": SwaggerMapper._count_by_method(result.endpoints),
-                "endpoints_with_request_body": sum(1 for ep in result.endpoints if ep.request_body),
-                "response_codes": SwaggerMapper._get_response_codes(result.endpoints)
+                "endpoints_by_method": endpoints_by_method,
+                "endpoints_with_request_body": endpoints_with_body,
+                "response_codes": response_codes
             }
         }
     
@@ -57,16 +59,13 @@ class SwaggerMapper:
     @staticmethod
     def _map_field(field: FieldInfo) -> Dict[str, Any]:
         """Map field to dictionary."""
-        constraints = []
-        if field.constraints:
-            for constraint in field.constraints:
-                # Handle ValidationConstraint domain objects properly
-                constraints.append({
-                    'constraint_type': constraint.constraint_type,
-                    'value': constraint.value,
-                    'error_code': constraint.error_code,
-                    'error_message': constraint.error_message
-                })
+        # Handle ValidationConstraint domain objects properly
+        constraints = [{
+            'constraint_type': constraint.constraint_type,
+            'value': constraint.value,
+            'error_code': constraint.error_code,
+            'error_message': constraint.error_message
+        } for constraint in field.constraints] if field.constraints else []
         
         return {
             "name": field.name,
@@ -98,22 +97,27 @@ class SwaggerMapper:
         }
     
     @staticmethod
-    def _count_by_method(endpoints: List[EndpointInfo]) -> Dict[str, int]:
-        """Count endpoints by HTTP method."""
+    def _summary_stats(endpoints: List[EndpointInfo]) -> Tuple[Dict[str, int], int, List[str]]:
+        """
+        Compute the summary statistics in a single pass over the endpoints.
+        
+        Args:
+            endpoints: Analyzed endpoints
+            
+        Returns:
+            Tuple of (endpoints by HTTP method, endpoints with request body,
+            sorted unique response codes)
+        """
         counts = {}
+        body_count = 0
+        codes = set()
         for endpoint in endpoints:
             method = endpoint.method.upper()
             counts[method] = counts.get(method, 0) + 1
-        return counts
-    
-    @staticmethod
-    def _get_response_codes(endpoints: List[EndpointInfo]) -> List[str]:
-        """Get all unique response codes."""
-        codes = set()
-        for endpoint in endpoints:
-            for response in endpoint.responses:
-                codes.add(response.status_code)
-        return sorted(list(codes))
+            if endpoint.request_body:
+                body_count += 1
+            codes.update(response.status_code for response in endpoint.responses)
+        return counts, body_count, sorted(codes)
     
     @staticmethod
     def _to_camel_case(text: str) -> str:
@@ -143,6 +143,10 @@ class TestCaseMapper:
         
         saved_files = []
         
+        # All endpoint files share the output directory: create it once for the batch
+        if results:
+            FileOperations.ensure_directory(output_dir)
+        
         # Create one file per endpoint
         for result in results:
             # Generate camelCase filename: postBeneficiarios.json, getBeneficiariosId.json
@@ -195,7 +199,7 @@ class TestCaseMapper:
             }
             
             # Use FileOperations to save JSON
-            FileOperations.save_json(output_data, file_path)
+            FileOperations.save_json(output_data, file_path, ensure_parent=False)
             saved_files.append(file_path)
         
         return saved_files
@@ -454,6 +458,10 @@ class TestCaseMapper:
         filename_gen = FilenameGenerator()
         saved_files = []
         
+        # All endpoint files share the output directory: create it once for the batch
+        if results:
+            FileOperations.ensure_directory(output_dir)
+        
         for result in results:
             # Generate consistent filename: {method}{endpoint}.json
             filename_base = filename_gen.generate(result.http_method, result.endpoint)
@@ -465,7 +473,7 @@ class TestCaseMapper:
             output_data["metadata"]["source_file"] = source_file
             
             # Use FileOperations to save JSON
-            FileOperations.save_json(output_data, file_path)
+            FileOperations.save_json(output_data, file_path, ensure_parent=False)
             saved_files.append(file_path)
         
         return saved_files
\ No newline at end of file
@@ -25,6 +25,9 @@ class FileOperations:
     JSON_ENSURE_ASCII = JSONConfig.ENSURE_ASCII
     JSON_ENCODING = JSONConfig.ENCODING
     
+    # Endpoint -> fragmento de nombre de archivo: "/" pasa a "_" y se eliminan las llaves de path params
+    ENDPOINT_FILENAME_TABLE = str.maketrans({"/": "_", "{": None, "}": None})
+    
     @staticmethod
     def ensure_directory(path: Path) -> Path:
         """
@@ -49,7 +52,8 @@ class FileOperations:
         data: Dict[str, Any],
         file_path: Path,
         indent: Optional[int] = None,
-        ensure_ascii: Optional[bool] = None
+        ensure_ascii: Optional[bool] = None,
+        ensure_parent: bool = True
     ) -> Path:
         """
         Guarda diccionario como JSON con formato consistente.
@@ -59,6 +63,8 @@ class FileOperations:
             file_path: Path del archivo destino
             indent: Indentación (default: 2)
             ensure_ascii: Escapar caracteres no-ASCII (default: False)
+            ensure_parent: Crear el directorio padre si no existe (False si el llamador
+                ya lo creó una vez para todo un lote de archivos)
             
         Returns:
             Path del archivo guardado
@@ -72,11 +78,13 @@ class FileOperations:
         
         try:
             # Asegurar que el directorio padre existe
-            FileOperations.ensure_directory(file_path.parent)
+            if ensure_parent:
+                FileOperations.ensure_directory(file_path.parent)
             
-            # Escribir JSON
+            # Serializar en memoria y escribir en una sola llamada (json.dump escribe fragmento a fragmento)
+            content = json.dumps(data, indent=indent, ensure_ascii=ensure_ascii)
             with open(file_path, 'w', encoding=FileOperations.JSON_ENCODING) as f:
-                json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+                f.write(content)
             
             logger.debug(f"JSON saved successfully: {file_path}")
             return file_path
@@ -125,7 +133,8 @@ class FileOperations:
         source: str,
         technique: Optional[str] = None,
         tool_version: str = None,
-        additional_fields: Optional[Dict[str, Any]] = None
+        additional_fields: Optional[Dict[str, Any]] = None,
+        generated_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Crea metadata estándar para archivos de output.
@@ -135,12 +144,14 @@ class FileOperations:
             technique: Técnica utilizada (opcional)
             tool_version: Versión de la herramienta
             additional_fields: Campos adicionales a incluir
+            generated_at: Timestamp ISO ya calculado (default: ahora); permite
+                compartir un único timestamp entre todos los archivos de un lote
             
         Returns:
             Diccionario con metadata estándar
         """
         metadata = {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": generated_at or datetime.now().isoformat(),
             "source": source,
             "tool_version": tool_version or VersionInfo.TOOL_VERSION
         }
@@ -124,6 +124,9 @@ class KarateGenerationService:
                 total_examples=total_examples,
                 errors=[error_msg]
             )
+        finally:
+            # Parsed test case files are only reused within this run
+            self.repository.clear_test_case_cache()
     
     def _validate_test_case_files(self, test_cases_dir: Path) -> Dict[str, Any]:
         """
@@ -185,6 +188,7 @@ class KarateGenerationService:
         """
         # Create output directory structure
         functional_dir = self._create_output_structure(output_dir)
+        self.repository.prepare_output_dirs(functional_dir)
         
         # Collect all headers from test cases for dynamic config generation
         all_headers = self._extract_headers_from_test_files(test_case_files)
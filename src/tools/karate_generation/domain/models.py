@@ -1,10 +1,79 @@
 """
 Domain models for Karate feature generation.
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Any, Optional, Set
 from enum import Enum
 
+from src.shared.utils.file_operations import FileOperations
+from .test_data_filter import TestDataFilter
+from .value_objects import HeaderExtractor
+
+
+# karate-config.js layout, built once at import and filled per config
+_CONFIG_TEMPLATE = """function fn() {{
+  var env = karate.env; // get system property 'karate.env'
+  karate.log('karate.env system property was:', env);
+  
+  if (!env) {{
+    env = 'dev';
+  }}
+  
+  var config = {{
+    baseUrl: '{base_url}',
+    timeout: {timeout},
+    retry: {retry}
+  }};
+  
+  // Helper function to generate UUIDs using Karate native
+  config.generateUUID = function() {{
+    return karate.uuid();
+  }};
+  
+  // Function to build request headers with automatic UUID generation
+  config.buildHeaders = function(overrides) {{
+    overrides = overrides || {{}};
+    var headers = {{
+{build_headers}
+    }};
+    
+    // Apply overrides
+    for (var key in overrides) {{
+      if (overrides[key] === null) {{
+        delete headers[key];
+      }} else {{
+        headers[key] = overrides[key];
+      }}
+    }}
+    
+    return headers;
+  }};
+  
+  // Environment specific configuration
+{env_conditions}
+  
+  karate.configure('connectTimeout', config.timeout);
+  karate.configure('readTimeout', config.timeout);
+  karate.configure('retry', {{ count: config.retry, interval: 5000 }});
+  
+  return config;
+}}"""
+
+# Human-readable descriptions for common HTTP status codes
+_HTTP_STATUS_DESCRIPTIONS: Dict[int, str] = {
+    200: "Success",
+    201: "Created",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Access Denied",
+    403: "Forbidden",
+    404: "Not Found",
+    500: "Internal Server Error"
+}
+
+# Generic tags dropped from scenario tag lists (replaced by semantic tags)
+_GENERIC_SCENARIO_TAGS = frozenset({"@negativeTest", "@status400", "@status401", "@status500"})
+
 
 class ScenarioType(Enum):
     """Types of test scenarios."""
@@ -21,7 +90,7 @@ class HttpMethod(Enum):
     PATCH = "PATCH"
 
 
-@dataclass
+@dataclass(slots=True)
 class KarateExample:
     """Represents a row in the Examples table of a Scenario Outline."""
     test_case_id: str
@@ -38,22 +107,11 @@ class KarateExample:
     @staticmethod
     def get_http_status_description(status_code: int) -> str:
         """Convert HTTP status code to human-readable description."""
-        status_map = {
-            200: "Success",
-            201: "Created",
-            204: "No Content",
-            400: "Bad Request",
-            401: "Access Denied",
-            403: "Forbidden",
-            404: "Not Found",
-            500: "Internal Server Error"
-        }
-        return status_map.get(status_code, str(status_code))
+        return _HTTP_STATUS_DESCRIPTIONS.get(status_code) or str(status_code)
     
     def get_short_test_id(self) -> str:
         """Generate a shorter, more readable test ID."""
         # Extract meaningful parts: method + endpoint + category
-        import re
         # EPGETprioritiesvalid_all20251128_96 -> GET-PRI-001
         parts = self.test_case_id.split('_')
         if len(parts) > 0:
@@ -64,10 +122,18 @@ class KarateExample:
             return base
         return self.test_case_id[:20]  # Fallback: first 20 chars
     
+    @property
+    def has_invalid_value(self) -> bool:
+        """Whether to_table_row() would include an 'invalidValue' column, without building the row."""
+        if self.header_validation:
+            header_name = self.header_validation.get("headerName", "")
+            return bool(TestDataFilter.extract_header_validation_fields(self.test_data, header_name))
+        
+        return ("invalidValue" in self.test_data and
+                TestDataFilter.should_include_field("invalidValue", self.test_data["invalidValue"]))
+    
     def to_table_row(self) -> Dict[str, Any]:
         """Convert to table row format with only necessary columns."""
-        from .test_data_filter import TestDataFilter
-        
         # If this is a header validation test, only include the specific header info
         if self.header_validation:
             header_name = self.header_validation.get("headerName", "")
@@ -81,20 +147,32 @@ class KarateExample:
             
             return row
         
-        # For non-header tests, start with minimal metadata
-        row = {}
-        
-        # Always include expectedStatus (critical for validations)
-        row["expectedStatus"] = self.expected_status
+        # For non-header tests: always include expectedStatus (critical for validations)
+        # followed by the non-header fields from test_data, built in a single dict display
+        return {
+            "expectedStatus": self.expected_status,
+            **TestDataFilter.exclude_headers(self.test_data)
+        }
+    
+    @staticmethod
+    def to_table_rows(examples: List["KarateExample"]) -> List[Dict[str, Any]]:
+        """
+        Convert several examples to table rows, equivalent to calling to_table_row() on each.
         
-        # Add non-header fields from test_data using TestDataFilter
-        filtered_data = TestDataFilter.exclude_headers(self.test_data)
-        row.update(filtered_data)
+        Header filtering for regular examples is done once for the whole batch.
+        """
+        plain_rows = iter(TestDataFilter.exclude_headers_batch(
+            [example.test_data for example in examples if not example.header_validation]
+        ))
         
-        return row
+        return [
+            example.to_table_row() if example.header_validation
+            else {"expectedStatus": example.expected_status, **next(plain_rows)}
+            for example in examples
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class KarateScenario:
     """Represents a Karate Scenario Outline."""
     name: str
@@ -107,7 +185,7 @@ class KarateScenario:
     
     def get_primary_tag(self) -> str:
         """Get the primary tag for this scenario."""
-        if self.scenario_type == ScenarioType.POSITIVE:
+        if self.scenario_type is ScenarioType.POSITIVE:
             return "@smoke"
         return "@regression"
     
@@ -116,7 +194,7 @@ class KarateScenario:
         tags = []
         
         # Add semantic tags based on scenario type
-        if self.scenario_type == ScenarioType.POSITIVE:
+        if self.scenario_type is ScenarioType.POSITIVE:
             tags.extend(["@smoke", "@happy-path"])
         else:
             tags.append("@error")
@@ -135,11 +213,10 @@ class KarateScenario:
                 elif status >= 500:
                     tags.append("@server-error")
         
-        # Add custom tags (filter out generic ones)
-        for tag in self.tags:
-            if tag not in ["@negativeTest", "@status400", "@status401", "@status500"]:
-                if tag not in tags:
-                    tags.append(tag)
+        # Add custom tags (filter out generic ones), order-preserving dedup
+        tags = list(dict.fromkeys(
+            [*tags, *(tag for tag in self.tags if tag not in _GENERIC_SCENARIO_TAGS)]
+        ))
         
         # Add regression tag
         tags.append("@regression")
@@ -147,7 +224,7 @@ class KarateScenario:
         return tags
 
 
-@dataclass
+@dataclass(slots=True)
 class KarateFeature:
     """Represents a complete Karate feature file."""
     feature_name: str
@@ -167,13 +244,13 @@ class KarateFeature:
             return self.source_filename.replace('.json', '.feature')
         
         # Fallback: generate from endpoint (shouldn't happen with proper mapping)
-        safe_endpoint = self.endpoint.replace("/", "_").replace("{", "").replace("}", "")
+        safe_endpoint = self.endpoint.translate(FileOperations.ENDPOINT_FILENAME_TABLE)
         if safe_endpoint.startswith("_"):
             safe_endpoint = safe_endpoint[1:]
         return f"{self.http_method.value}_{safe_endpoint}.feature"
 
 
-@dataclass
+@dataclass(slots=True)
 class KarateConfig:
     """Represents karate-config.js configuration."""
     base_url: str
@@ -185,88 +262,44 @@ class KarateConfig:
     
     def generate_config_content(self) -> str:
         """Generate the karate-config.js content."""
-        env_conditions = self._format_environment_conditions()
-        
-        return f"""function fn() {{
-  var env = karate.env; // get system property 'karate.env'
-  karate.log('karate.env system property was:', env);
-  
-  if (!env) {{
-    env = 'dev';
-  }}
-  
-  var config = {{
-    baseUrl: '{self.base_url}',
-    timeout: {self.timeout},
-    retry: {self.retry}
-  }};
-  
-  // Helper function to generate UUIDs using Karate native
-  config.generateUUID = function() {{
-    return karate.uuid();
-  }};
-  
-  // Function to build request headers with automatic UUID generation
-  config.buildHeaders = function(overrides) {{
-    overrides = overrides || {{}};
-    var headers = {{
-{self._format_all_headers_for_build()}
-    }};
-    
-    // Apply overrides
-    for (var key in overrides) {{
-      if (overrides[key] === null) {{
-        delete headers[key];
-      }} else {{
-        headers[key] = overrides[key];
-      }}
-    }}
-    
-    return headers;
-  }};
-  
-  // Environment specific configuration
-{env_conditions}
-  
-  karate.configure('connectTimeout', config.timeout);
-  karate.configure('readTimeout', config.timeout);
-  karate.configure('retry', {{ count: config.retry, interval: 5000 }});
-  
-  return config;
-}}"""
+        return _CONFIG_TEMPLATE.format(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            retry=self.retry,
+            build_headers=self._format_all_headers_for_build(),
+            env_conditions=self._format_environment_conditions()
+        )
     
     def _format_headers(self) -> str:
         """Format headers for config file."""
-        lines = []
-        for key, value in self.headers.items():
-            lines.append(f"    '{key}': '{value}'")
-        return ",\n".join(lines)
+        return ",\n".join(f"    '{key}': '{value}'" for key, value in self.headers.items())
     
     def _format_all_headers_for_build(self) -> str:
         """Format all headers for buildHeaders() function with automatic UUID generation."""
-        from .value_objects import HeaderExtractor
+        # Add all headers from swagger dynamically
+        return ",\n".join(
+            self._format_build_header_line(header_name, metadata)
+            for header_name, metadata in sorted(self.dynamic_headers.items())
+        )
+    
+    def _format_build_header_line(self, header_name: str, metadata: Dict[str, Any]) -> str:
+        """Format a single buildHeaders() entry."""
+        description = metadata.get("description", "")
         
-        lines = []
+        # Check if header requires UUID generation
+        if HeaderExtractor.is_uuid_header(header_name, description):
+            return f"      '{header_name}': config.generateUUID()"
         
-        # Add all headers from swagger dynamically
-        for header_name, metadata in sorted(self.dynamic_headers.items()):
-            description = metadata.get("description", "")
-            is_required = metadata.get("required", False)
-            
-            # Check if header requires UUID generation
-            if HeaderExtractor.is_uuid_header(header_name, description):
-                lines.append(f"      '{header_name}': config.generateUUID()")
-            elif "value" in metadata:
-                # Header has a default value from swagger (Content-Type, Accept)
-                lines.append(f"      '{header_name}': '{metadata['value']}'")
-            else:
-                # Non-UUID headers: use environment variable or default value
-                # Format: karate.properties['header.name'] || 'DEFAULT_VALUE'
-                default_value = self._generate_default_header_value(header_name, is_required)
-                env_var = self._header_to_env_var(header_name)
-                lines.append(f"      '{header_name}': karate.properties['{env_var}'] || '{default_value}'")
+        if "value" in metadata:
+            # Header has a default value from swagger (Content-Type, Accept)
+            return f"      '{header_name}': '{metadata['value']}'"
         
-        return ",\n".join(lines)
+        # Non-UUID headers: use environment variable or default value
+        # Format: karate.properties['header.name'] || 'DEFAULT_VALUE'
+        is_required = metadata.get("required", False)
+        default_value = self._generate_default_header_value(header_name, is_required)
+        env_var = self._header_to_env_var(header_name)
+        return f"      '{header_name}': karate.properties['{env_var}'] || '{default_value}'"
     
     def _header_to_env_var(self, header_name: str) -> str:
         """Convert header name to environment variable format."""
@@ -309,15 +342,13 @@ class KarateConfig:
         if not self.environments:
             return ""
         
-        conditions = []
-        for i, (env_name, env_url) in enumerate(self.environments.items()):
-            condition_type = "if" if i == 0 else "else if"
-            conditions.append(f"  {condition_type} (env === '{env_name}') {{\n    config.baseUrl = '{env_url}';\n  }}")
-        
-        return "\n".join(conditions)
+        return "\n".join(
+            f"  {'if' if i == 0 else 'else if'} (env === '{env_name}') {{\n    config.baseUrl = '{env_url}';\n  }}"
+            for i, (env_name, env_url) in enumerate(self.environments.items())
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class KarateGenerationResult:
     """Result of Karate feature generation."""
     success: bool
@@ -329,11 +360,8 @@ class KarateGenerationResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "success": self.success,
-            "features_generated": self.features_generated,
-            "config_file": self.config_file,
-            "total_scenarios": self.total_scenarios,
-            "total_examples": self.total_examples,
-            "errors": self.errors
-        }
\ No newline at end of file
+        # Field names are resolved once at import; values are shared, not deep-copied like asdict()
+        return {name: getattr(self, name) for name in _GENERATION_RESULT_FIELDS}
+
+
+_GENERATION_RESULT_FIELDS = tuple(f.name for f in fields(KarateGenerationResult))
\ No newline at end of file
@@ -27,6 +27,27 @@ class KarateGeneratorRepository(ABC):
         """
         pass
     
+    def prepare_output_dirs(self, output_dir: Path) -> None:
+        """
+        Prepare output directories before a batch of saves.
+        
+        Optional hook; implementations that write to disk can create all
+        required directories once here instead of on every save.
+        
+        Args:
+            output_dir: Output directory path
+        """
+        pass
+    
+    def clear_test_case_cache(self) -> None:
+        """
+        Release test case data cached during a generation run.
+        
+        Optional hook; implementations that keep parsed test case files
+        between listing and loading drop them here once the run is over.
+        """
+        pass
+    
     @abstractmethod
     def save_feature(self, feature: KarateFeature, output_dir: Path) -> Path:
         """
@@ -2,7 +2,9 @@
 Test data filtering utilities for Karate generation.
 Extracts complex filtering logic to follow Single Responsibility Principle.
 """
-from typing import Dict, Any, Set, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Set, Optional, FrozenSet
 from .value_objects import HeaderExtractor
 
 
@@ -25,7 +27,7 @@ class TestDataFilter:
     }
     
     # Instance-level known headers (injected dynamically)
-    _known_headers: Optional[Set[str]] = None
+    _known_headers: Optional[FrozenSet[str]] = None
     
     @classmethod
     def configure(cls, known_headers: Set[str]):
@@ -35,7 +37,8 @@ class TestDataFilter:
         Args:
             known_headers: Set of header names found in the API specification
         """
-        cls._known_headers = {h.lower() for h in known_headers}
+        cls._known_headers = frozenset(h.lower() for h in known_headers)
+        _is_header_field_cached.cache_clear()
     
     @classmethod
     def is_header_field(cls, field_name: str) -> bool:
@@ -55,31 +58,7 @@ class TestDataFilter:
         Returns:
             True if field is likely a header
         """
-        field_lower = field_name.lower()
-        
-        # 1. Check against known headers from Swagger (highest priority)
-        if cls._known_headers and field_lower in cls._known_headers:
-            return True
-        
-        # 2. Check standard HTTP headers
-        if field_lower in cls.GENERIC_HEADER_PATTERNS['standard_http']:
-            return True
-        
-        # 3. Check generic starts_with patterns
-        if any(field_name.startswith(prefix) or field_lower.startswith(prefix.lower()) 
-               for prefix in cls.GENERIC_HEADER_PATTERNS['starts_with']):
-            return True
-        
-        # 4. Check generic contains patterns with context (avoid false positives)
-        for pattern in cls.GENERIC_HEADER_PATTERNS['contains']:
-            if pattern in field_lower:
-                # Additional context check: field should have header-like structure
-                # e.g., has dashes or is compound word
-                if '-' in field_name or field_name[0].isupper():
-                    return True
-        
-        # 5. Use HeaderExtractor as final fallback
-        return HeaderExtractor.is_header_field(field_name)
+        return _is_header_field_cached(field_name, cls._known_headers)
     
     @staticmethod
     def exclude_headers(test_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -92,20 +71,40 @@ class TestDataFilter:
         Returns:
             Dictionary with only non-header fields that have actual values
         """
-        filtered = {}
+        # Bind the cached lookup once: this runs for every key of every example row
+        known_headers = TestDataFilter._known_headers
         
-        for key, value in test_data.items():
-            # Skip if it's a header field
-            if TestDataFilter.is_header_field(key):
-                continue
-            
-            # Skip if value is empty/null
-            if value in [None, "", [], {}]:
-                continue
-            
-            filtered[key] = value
+        # Skip header fields and empty/null values
+        return {
+            key: value
+            for key, value in test_data.items()
+            if not _is_empty_value(value) and not _is_header_field_cached(key, known_headers)
+        }
+    
+    @staticmethod
+    def exclude_headers_batch(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Filter out header fields from many test data rows at once.
         
-        return filtered
+        Rows of the same scenario share a small key set, so header detection
+        runs once per distinct key instead of once per key per row.
+        
+        Args:
+            rows: Test data dictionaries containing potential headers
+            
+        Returns:
+            Filtered dictionaries, in the same order as the input rows
+        """
+        header_keys = {key for key in set().union(*rows) if TestDataFilter.is_header_field(key)}
+        
+        return [
+            {
+                key: value
+                for key, value in row.items()
+                if key not in header_keys and not _is_empty_value(value)
+            }
+            for row in rows
+        ]
     
     @staticmethod
     def extract_header_validation_fields(test_data: Dict[str, Any], header_name: str) -> Dict[str, Any]:
@@ -124,7 +123,7 @@ class TestDataFilter:
         # Only include the specific header if it has a non-null/non-empty value
         if header_name in test_data:
             value = test_data[header_name]
-            if value not in [None, "", [], {}]:
+            if not _is_empty_value(value):
                 result['invalidValue'] = value
         
         return result
@@ -146,7 +145,7 @@ class TestDataFilter:
             return False
         
         # Exclude empty values
-        if value in [None, "", [], {}]:
+        if _is_empty_value(value):
             return False
         
         return True
@@ -166,3 +165,51 @@ class TestDataFilter:
             'expectedError', 'expected_error', 'error',
             'priority'
         }
+
+
+def _is_empty_value(value: Any) -> bool:
+    """Check for None, "", [] or {} without building a sentinel list per call."""
+    return value is None or value == "" or (isinstance(value, (list, dict)) and not value)
+
+
+# Pattern containers materialized once for the cached lookup below
+_STANDARD_HTTP_HEADERS = frozenset(TestDataFilter.GENERIC_HEADER_PATTERNS['standard_http'])
+# Prefixes are checked against the lowered name, so their case variants collapse
+_STARTS_WITH_PATTERNS = tuple(dict.fromkeys(
+    prefix.lower() for prefix in TestDataFilter.GENERIC_HEADER_PATTERNS['starts_with']
+))
+# All 'contains' patterns matched in a single scan
+_CONTAINS_RE = re.compile('|'.join(map(re.escape, TestDataFilter.GENERIC_HEADER_PATTERNS['contains'])))
+
+
+@lru_cache(maxsize=4096)
+def _is_header_field_cached(field_name: str, known_headers: Optional[FrozenSet[str]]) -> bool:
+    """
+    Cached implementation of TestDataFilter.is_header_field.
+    
+    Field names repeat across every example row, so results are memoized per
+    (field_name, known_headers). The cache is cleared on TestDataFilter.configure().
+    """
+    field_lower = field_name.lower()
+    
+    # 1. Check against known headers from Swagger (highest priority)
+    if known_headers and field_lower in known_headers:
+        return True
+    
+    # 2. Check standard HTTP headers
+    if field_lower in _STANDARD_HTTP_HEADERS:
+        return True
+    
+    # 3. Check generic starts_with patterns
+    if field_lower.startswith(_STARTS_WITH_PATTERNS):
+        return True
+    
+    # 4. Check generic contains patterns with context (avoid false positives)
+    if _CONTAINS_RE.search(field_lower):
+        # Additional context check: field should have header-like structure
+        # e.g., has dashes or is compound word
+        if '-' in field_name or field_name[0].isupper():
+            return True
+    
+    # 5. Use HeaderExtractor as final fallback
+    return HeaderExtractor.is_header_field(field_name)
@@ -2,10 +2,40 @@
 Value objects for Karate generation domain.
 Encapsulates business logic for creating dynamic configurations.
 """
-from typing import Dict, Set
+import re
+from functools import lru_cache
+from typing import Dict, Set, FrozenSet, Tuple
 from urllib.parse import urlparse
 
 
+# Header hint detection patterns, compiled once at import
+_DASH_HEADER_RE = re.compile(r'\b([A-Za-z]+-[A-Za-z]+(?:-[A-Za-z]+)*)\b')
+_HINT_HEADER_SUFFIXES = ('-id', '-key', '-token', '-type', '-name', '-consumidor', '-aplicacion',
+                         '-servicio', '-subscription', '-apim', '-api')
+_HINT_HEADER_PREFIXES = ('x-', 'ocp-')
+_HINT_KNOWN_HEADERS = frozenset({'transaccion-id', 'aplicacion-id', 'nombre-aplicacion',
+                                 'usuario-consumidor-id', 'nombre-servicio-consumidor',
+                                 'ocp-apim-subscription-key'})
+_HINT_COMMON_HEADERS = ('authorization', 'content-type', 'accept')
+# The keywords cannot overlap one another, so one findall sees every keyword present
+_HINT_COMMON_RE = re.compile('|'.join(map(re.escape, _HINT_COMMON_HEADERS)))
+
+# Hostnames that get the standard localhost dev/qa/prod layout
+_LOCAL_HOSTNAMES = frozenset({"localhost", "127.0.0.1"})
+
+# (environment, URL template) pairs for local and domain-based base URLs
+_LOCAL_ENVIRONMENT_TEMPLATES = (
+    ("dev", "{scheme}://localhost{port}"),
+    ("qa", "{scheme}://qa-api.example.com{port}"),
+    ("prod", "{scheme}://api.example.com{port}"),
+)
+_DOMAIN_ENVIRONMENT_TEMPLATES = (
+    ("dev", "{scheme}://dev-{subdomain}.{domain}"),
+    ("qa", "{scheme}://qa-{subdomain}.{domain}"),
+    ("prod", "{scheme}://{subdomain}.{domain}"),
+)
+
+
 class EnvironmentGenerator:
     """Generates environment configurations dynamically from base URL."""
     
@@ -20,38 +50,41 @@ class EnvironmentGenerator:
         Returns:
             Dictionary with environment names and URLs
         """
-        parsed = urlparse(base_url)
-        hostname = parsed.hostname or "localhost"
-        port = parsed.port
-        scheme = parsed.scheme or "http"
-        
-        environments = {}
-        
-        # If localhost, generate standard dev/qa/prod pattern
-        if hostname in ["localhost", "127.0.0.1"]:
-            port_str = f":{port}" if port else ""
-            environments["dev"] = f"{scheme}://localhost{port_str}"
-            environments["qa"] = f"{scheme}://qa-api.example.com{port_str}"
-            environments["prod"] = f"{scheme}://api.example.com{port_str}"
-        else:
-            # Extract domain pattern and generate variants
-            domain_parts = hostname.split(".")
-            
-            if len(domain_parts) >= 2:
-                # e.g., api.example.com -> dev-api.example.com, qa-api.example.com
-                base_domain = ".".join(domain_parts[-2:])
-                subdomain = domain_parts[0] if len(domain_parts) > 2 else "api"
-                
-                environments["dev"] = f"{scheme}://dev-{subdomain}.{base_domain}"
-                environments["qa"] = f"{scheme}://qa-{subdomain}.{base_domain}"
-                environments["prod"] = f"{scheme}://{subdomain}.{base_domain}"
-            else:
-                # Simple hostname, use as-is for all environments
-                environments["dev"] = base_url
-                environments["qa"] = base_url
-                environments["prod"] = base_url
-        
-        return environments
+        # Cached per base URL; return a fresh dict so callers may mutate it
+        return dict(_generate_environments_cached(base_url))
+
+
+@lru_cache(maxsize=64)
+def _generate_environments_cached(base_url: str) -> Tuple[Tuple[str, str], ...]:
+    """Cached implementation of EnvironmentGenerator.generate_environments."""
+    parsed = urlparse(base_url)
+    hostname = parsed.hostname or "localhost"
+    port = parsed.port
+    scheme = parsed.scheme or "http"
+    
+    # If localhost, generate standard dev/qa/prod pattern
+    if hostname in _LOCAL_HOSTNAMES:
+        port_str = f":{port}" if port else ""
+        return tuple(
+            (name, template.format(scheme=scheme, port=port_str))
+            for name, template in _LOCAL_ENVIRONMENT_TEMPLATES
+        )
+    
+    # Extract domain pattern and generate variants
+    domain_parts = hostname.split(".")
+    
+    if len(domain_parts) >= 2:
+        # e.g., api.example.com -> dev-api.example.com, qa-api.example.com
+        base_domain = ".".join(domain_parts[-2:])
+        subdomain = domain_parts[0] if len(domain_parts) > 2 else "api"
+        
+        return tuple(
+            (name, template.format(scheme=scheme, subdomain=subdomain, domain=base_domain))
+            for name, template in _DOMAIN_ENVIRONMENT_TEMPLATES
+        )
+    
+    # Simple hostname, use as-is for all environments
+    return (("dev", base_url), ("qa", base_url), ("prod", base_url))
 
 
 class ValidationCategory:
@@ -62,24 +95,28 @@ class ValidationCategory:
     LENGTH = "length"
     VALIDATION = "validation"
     
+    # Shared immutable sets, built once instead of on every call
+    _ALL_CATEGORIES = frozenset({REQUIRED, FORMAT, TYPE, LENGTH, VALIDATION})
+    _HEADER_VALIDATION_CATEGORIES = frozenset({REQUIRED, FORMAT, TYPE, LENGTH})
+    
     @classmethod
-    def get_all_categories(cls) -> Set[str]:
+    def get_all_categories(cls) -> FrozenSet[str]:
         """Get all validation categories."""
-        return {cls.REQUIRED, cls.FORMAT, cls.TYPE, cls.LENGTH, cls.VALIDATION}
+        return cls._ALL_CATEGORIES
     
     @classmethod
     def is_header_validation_category(cls, category: str) -> bool:
         """Check if category is related to header validation."""
-        return category in {cls.REQUIRED, cls.FORMAT, cls.TYPE, cls.LENGTH}
+        return category in cls._HEADER_VALIDATION_CATEGORIES
 
 
 class HeaderExtractor:
     """Extracts and identifies headers dynamically from test data."""
     
     # Common header patterns to identify
-    COMMON_HEADER_PREFIXES = ["x-", "authorization", "content-", "accept"]
-    UUID_HEADER_PATTERNS = ["correlation-id", "request-id", "transaction-id", "trace-id", "transaccion-id"]
-    UUID_DESCRIPTION_KEYWORDS = ["uuid", "guid", "randomuuid", "unique identifier"]
+    COMMON_HEADER_PREFIXES = ("x-", "authorization", "content-", "accept")
+    UUID_HEADER_PATTERNS = ("correlation-id", "request-id", "transaction-id", "trace-id", "transaccion-id")
+    UUID_DESCRIPTION_KEYWORDS = ("uuid", "guid", "randomuuid", "unique identifier")
     
     @staticmethod
     def extract_headers_from_test_data(test_data: Dict) -> Set[str]:
@@ -92,14 +129,9 @@ class HeaderExtractor:
         Returns:
             Set of header names found in test data
         """
-        headers = set()
-        
-        # Check if test_data has header keys using dynamic patterns
-        for key in test_data.keys():
-            if HeaderExtractor.is_header_field(key):
-                headers.add(key)
-        
-        return headers
+        # Check if test_data has header keys using dynamic patterns (same test as is_header_field)
+        prefixes = HeaderExtractor.COMMON_HEADER_PREFIXES
+        return {key for key in test_data if key.lower().startswith(prefixes)}
     
     @staticmethod
     def is_header_field(field_name: str) -> bool:
@@ -112,8 +144,7 @@ class HeaderExtractor:
         Returns:
             True if field represents a header
         """
-        field_lower = field_name.lower()
-        return any(field_lower.startswith(prefix) for prefix in HeaderExtractor.COMMON_HEADER_PREFIXES)
+        return field_name.lower().startswith(HeaderExtractor.COMMON_HEADER_PREFIXES)
     
     @staticmethod
     def is_uuid_header(header_name: str, description: str = "") -> bool:
@@ -127,16 +158,7 @@ class HeaderExtractor:
         Returns:
             True if header typically contains UUIDs
         """
-        # Check by header name pattern
-        if any(pattern in header_name.lower() for pattern in HeaderExtractor.UUID_HEADER_PATTERNS):
-            return True
-        
-        # Check by description keywords
-        if description:
-            desc_lower = description.lower()
-            return any(keyword in desc_lower for keyword in HeaderExtractor.UUID_DESCRIPTION_KEYWORDS)
-        
-        return False
+        return _is_uuid_header_cached(header_name, description)
     
     @staticmethod
     def extract_header_name_from_field(field_name: str) -> str:
@@ -162,37 +184,46 @@ class HeaderExtractor:
         Returns:
             Set of detected header names
         """
-        import re
-        detected = set()
-        
-        # Pattern 1: Headers with dashes (x-correlation-id, Transaccion-Id, Aplicacion-Id, etc.)
-        # Match word boundaries with Title-Case or lowercase patterns
-        dash_pattern = r'\b([A-Za-z]+-[A-Za-z]+(?:-[A-Za-z]+)*)\b'
-        dash_headers = re.findall(dash_pattern, text)
-        
-        # Filter to only keep likely headers (contain common suffixes or are known patterns)
-        header_suffixes = ['-id', '-key', '-token', '-type', '-name', '-consumidor', '-aplicacion', 
-                          '-servicio', '-subscription', '-apim', '-api']
-        header_prefixes = ['x-', 'ocp-']
-        
-        for header in dash_headers:
+        return set(_detect_header_hints_cached(text))
+
+
+# UUID header name patterns and description keywords as alternations, so a single scan checks them all
+_UUID_HEADER_RE = re.compile('|'.join(map(re.escape, HeaderExtractor.UUID_HEADER_PATTERNS)))
+_UUID_DESCRIPTION_RE = re.compile('|'.join(map(re.escape, HeaderExtractor.UUID_DESCRIPTION_KEYWORDS)))
+
+
+@lru_cache(maxsize=1024)
+def _is_uuid_header_cached(header_name: str, description: str) -> bool:
+    """Cached implementation of HeaderExtractor.is_uuid_header."""
+    # Check by header name pattern
+    if _UUID_HEADER_RE.search(header_name.lower()):
+        return True
+    
+    # Check by description keywords
+    if description:
+        return _UUID_DESCRIPTION_RE.search(description.lower()) is not None
+    
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _detect_header_hints_cached(text: str) -> FrozenSet[str]:
+    """Cached implementation of HeaderExtractor.detect_header_hints_in_text."""
+    # Pattern 2 first: common header keywords, all found in a single scan
+    detected = set(_HINT_COMMON_RE.findall(text.lower()))
+    
+    # Pattern 1: Headers with dashes (x-correlation-id, Transaccion-Id, Aplicacion-Id, etc.)
+    # Match word boundaries with Title-Case or lowercase patterns; text without a dash cannot match
+    if '-' in text:
+        for header in _DASH_HEADER_RE.findall(text):
             header_lower = header.lower()
-            # Check if it matches header patterns
-            is_header = (
-                any(header_lower.startswith(prefix) for prefix in header_prefixes) or
-                any(header_lower.endswith(suffix) for suffix in header_suffixes) or
-                header_lower in ['transaccion-id', 'aplicacion-id', 'nombre-aplicacion',
-                                'usuario-consumidor-id', 'nombre-servicio-consumidor',
-                                'ocp-apim-subscription-key']
-            )
-            if is_header:
-                detected.add(header)
-        
-        # Pattern 2: Check for common header keywords
-        text_lower = text.lower()
-        common_headers = ['authorization', 'content-type', 'accept']
-        for header in common_headers:
-            if header in text_lower:
+            # Keep only likely headers (common prefixes/suffixes or known names)
+            if (header_lower.startswith(_HINT_HEADER_PREFIXES) or
+                    header_lower.endswith(_HINT_HEADER_SUFFIXES) or
+                    header_lower in _HINT_KNOWN_HEADERS):
                 detected.add(header)
-        
-        return detected
+    
+    return frozenset(detected)
+
+
+__all__ = ["EnvironmentGenerator", "ValidationCategory", "HeaderExtractor"]
@@ -1,6 +1,8 @@
 """
 Builder for Karate feature file content using Gherkin syntax.
 """
+import io
+import re
 from typing import List, Dict, Any, Set
 from ..domain.models import (
     KarateFeature, 
@@ -13,9 +15,21 @@ from ..domain.value_objects import HeaderExtractor
 from ..config import FEATURE_CONFIG
 
 
+# Path parameter patterns, compiled once at import
+_PATH_PARAM_RE = re.compile(r'\{([^}]+)\}')
+_PATH_SPLIT_RE = re.compile(r'(\{[^}]+\})')
+
+# Enum members compared by identity, and the methods that send a request body
+_POSITIVE_TYPE = ScenarioType.POSITIVE
+_NEGATIVE_TYPE = ScenarioType.NEGATIVE
+_BODY_METHODS = frozenset({HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH})
+
+
 class KarateFeatureBuilder:
     """Builds Karate feature file content with proper Gherkin syntax."""
     
+    __slots__ = ("indent", "config")
+    
     def __init__(self):
         self.indent = " " * FEATURE_CONFIG.INDENT_SPACES
         self.config = FEATURE_CONFIG
@@ -30,147 +44,129 @@ class KarateFeatureBuilder:
         Returns:
             Complete feature file content as string
         """
-        sections = [
-            self._build_header(feature),
-            self._build_feature_description(feature),
-            self._build_background(feature),
-            self._build_scenarios(feature)
-        ]
-        
-        return "\n\n".join(filter(None, sections))
+        # Path steps depend only on the endpoint, so they are built once per feature
+        path_steps = self._build_path_steps(feature.endpoint)
+        
+        # Every section is written straight into one buffer, separated by blank lines
+        buf = io.StringIO()
+        self._build_header(feature, buf)
+        buf.write("\n\n")
+        self._build_feature_description(feature, buf)
+        buf.write("\n\n")
+        self._build_background(feature, buf)
+        self._build_scenarios(feature, path_steps, buf)
+        
+        return buf.getvalue()
     
-    def _build_header(self, feature: KarateFeature) -> str:
-        """Build feature file header with tags."""
-        tags = [
-            self.config.REGRESSION_TAG,
-            "@api"
-        ]
-        return " ".join(tags)
+    def _build_header(self, feature: KarateFeature, buf: io.StringIO) -> None:
+        """Write feature file header with tags."""
+        buf.write(f"{self.config.REGRESSION_TAG} @api")
     
-    def _build_feature_description(self, feature: KarateFeature) -> str:
-        """Build feature description section."""
-        return f"Feature: {feature.feature_name}"
+    def _build_feature_description(self, feature: KarateFeature, buf: io.StringIO) -> None:
+        """Write feature description section."""
+        buf.write(f"Feature: {feature.feature_name}")
     
-    def _build_background(self, feature: KarateFeature) -> str:
-        """Build background section with centralized header configuration."""
-        lines = ["Background:"]
-        
-        # Use centralized baseUrl from config
-        lines.append(f"{self.indent}Given url baseUrl")
-        
-        # Build headers using centralized config function with automatic UUID generation
-        lines.append(f"{self.indent}* def configHeader = karate.call('classpath:karate-config.js').buildHeaders({{}})")
+    def _build_background(self, feature: KarateFeature, buf: io.StringIO) -> None:
+        """Write background section with centralized header configuration."""
+        indent = self.indent
         
-        return "\n".join(lines)
+        # Fixed layout: centralized baseUrl from config, then headers from the centralized
+        # config function with automatic UUID generation
+        buf.write(
+            f"Background:\n"
+            f"{indent}Given url baseUrl\n"
+            f"{indent}* def configHeader = karate.call('classpath:karate-config.js').buildHeaders({{}})"
+        )
     
-    def _feature_uses_header(self, feature: KarateFeature, header_pattern: str) -> bool:
-        """Check if feature uses a specific header."""
+    def _build_scenarios(self, feature: KarateFeature, path_steps: List[str], buf: io.StringIO) -> None:
+        """Write all scenario outlines, each preceded by a blank line."""
+        # Single pass: split positives from negatives, grouping negatives by the
+        # HTTP status of their first example (negatives without examples are skipped)
+        positive_scenarios: List[KarateScenario] = []
+        negative_by_status: Dict[int, List[KarateScenario]] = {}
         for scenario in feature.scenarios:
-            for example in scenario.examples:
-                test_data = example.test_data
-                for key in test_data.keys():
-                    if header_pattern in key.lower():
-                        return True
-        return False
-    
-    def _extract_feature_headers(self, feature: KarateFeature) -> Set[str]:
-        """Extract all unique headers used in feature."""
-        from ..domain.value_objects import HeaderExtractor
-        
-        headers = set()
-        for scenario in feature.scenarios:
-            for example in scenario.examples:
-                test_data = example.test_data
-                for key in test_data.keys():
-                    if HeaderExtractor.is_header_field(key):
-                        headers.add(key.lower())
-        return headers
-    
-    def _get_header_config(self, header_name: str) -> str:
-        """Generate configuration line for a specific header."""
-        from ..domain.value_objects import HeaderExtractor
-        
-        # Generate variable name (camelCase)
-        var_name = self._to_camel_case(header_name)
-        
-        # All headers now come from buildHeaders() - this method is deprecated
-        # Kept for backward compatibility only
-        return f"{self.indent}# Header '{header_name}' managed by buildHeaders()"
-    
-    def _build_scenarios(self, feature: KarateFeature) -> str:
-        """Build all scenario outlines."""
-        scenarios = []
-        
-        # Group scenarios by type
-        positive_scenarios = [s for s in feature.scenarios if s.scenario_type == ScenarioType.POSITIVE]
-        negative_scenarios = [s for s in feature.scenarios if s.scenario_type == ScenarioType.NEGATIVE]
+            if scenario.scenario_type is _POSITIVE_TYPE:
+                positive_scenarios.append(scenario)
+            elif scenario.examples:
+                negative_by_status.setdefault(scenario.examples[0].expected_status, []).append(scenario)
         
         # Build positive scenarios first
         for scenario in positive_scenarios:
-            scenarios.append(self._build_scenario_outline(scenario, feature))
+            buf.write("\n\n")
+            self._build_scenario_outline(scenario, feature, path_steps, buf)
         
-        # Then negative scenarios grouped by HTTP status
-        negative_by_status = self._group_scenarios_by_status(negative_scenarios)
+        # Then negative scenarios ordered by HTTP status
         for status, scenarios_list in sorted(negative_by_status.items()):
             for scenario in scenarios_list:
-                scenarios.append(self._build_scenario_outline(scenario, feature))
-        
-        return "\n\n".join(scenarios)
+                buf.write("\n\n")
+                self._build_scenario_outline(scenario, feature, path_steps, buf)
     
-    def _build_scenario_outline(self, scenario: KarateScenario, feature: KarateFeature) -> str:
-        """Build a single scenario outline."""
-        lines = []
-        
+    def _build_scenario_outline(
+        self,
+        scenario: KarateScenario,
+        feature: KarateFeature,
+        path_steps: List[str],
+        buf: io.StringIO
+    ) -> None:
+        """Write a single scenario outline."""
         # Tags
-        tags = scenario.get_all_tags()
-        lines.append(f"{' '.join(tags)}")
+        indent = self.indent
         
-        # Scenario name
-        lines.append(f"Scenario Outline: {scenario.name}")
+        # Tags and scenario name
+        buf.write(f"{' '.join(scenario.get_all_tags())}\nScenario Outline: {scenario.name}")
         
         # Description if available
         if scenario.description:
-            lines.append(f"{self.indent}# {scenario.description}")
-        
-        # Given-When-Then steps
-        lines.extend(self._build_scenario_steps(scenario, feature))
+            buf.write(f"\n{indent}# {scenario.description}")
         
-        # Examples table
-        lines.append("")
-        lines.append(f"{self.indent}Examples:")
-        lines.extend(self._build_examples_table(scenario.examples))
-        
-        return "\n".join(lines)
+        # Given-When-Then steps, then the Examples heading
+        steps = "\n".join(self._build_scenario_steps(scenario, feature, path_steps))
+        buf.write(f"\n{steps}\n\n{indent}Examples:")
+        self._build_examples_table(scenario.examples, buf)
     
-    def _build_scenario_steps(self, scenario: KarateScenario, feature: KarateFeature) -> List[str]:
-        """Build Given-When-Then steps for scenario."""
+    def _build_path_steps(self, endpoint: str) -> List[str]:
+        """Build the path definition steps shared by every scenario of a feature."""
         steps = []
         indent = self.indent
         
-        # Detect if this is a header validation scenario
-        is_header_validation = self._is_header_validation_scenario(scenario)
-        
         # Build dynamic path using Karate path() method
-        if "{" in feature.endpoint:
+        if "{" in endpoint:
             # FIXED: Extract and define path params BEFORE using them in path
-            path_params = self._extract_path_params(feature.endpoint)
+            path_params = self._extract_path_params(endpoint)
             for param in path_params:
                 steps.append(f"{indent}* def {param} = '<{param}>'")
             
             # Now build the path using already defined variables
-            path_parts = self._build_dynamic_path(feature.endpoint)
+            path_parts = self._build_dynamic_path(endpoint)
             steps.append(f"{indent}Given path {path_parts}")
         else:
             # Static path
-            steps.append(f"{indent}Given path '{feature.endpoint}'")
+            steps.append(f"{indent}Given path '{endpoint}'")
+        
+        return steps
+    
+    def _build_scenario_steps(
+        self,
+        scenario: KarateScenario,
+        feature: KarateFeature,
+        path_steps: List[str]
+    ) -> List[str]:
+        """Build Given-When-Then steps for scenario."""
+        indent = self.indent
+        
+        # Detect if this is a header validation scenario
+        is_header_validation = self._is_header_validation_scenario(scenario)
+        
+        # Start from the feature's path steps
+        steps = list(path_steps)
         
         # Add conditional header manipulation for header validation tests
-        if is_header_validation and scenario.scenario_type == ScenarioType.NEGATIVE:
+        if is_header_validation and scenario.scenario_type is _NEGATIVE_TYPE:
             # Copy valid headers first
             steps.append(f"{indent}* def headers = configHeader")
             
             # Check if this is type validation (has invalidValue) or required validation (missing header)
-            has_invalid_value = any('invalidValue' in ex.to_table_row() for ex in scenario.examples)
+            has_invalid_value = any(ex.has_invalid_value for ex in scenario.examples)
             
             if has_invalid_value:
                 # Type validation: set invalid value
@@ -186,7 +182,7 @@ class KarateFeatureBuilder:
             steps.append(f"{indent}And headers configHeader")
         
         # Set request body for POST/PUT/PATCH
-        if feature.http_method in [HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH]:
+        if feature.http_method in _BODY_METHODS:
             if is_header_validation:
                 # For header validation, use a minimal valid body
                 steps.append(f"{indent}And request {{}}")
@@ -205,7 +201,7 @@ class KarateFeatureBuilder:
             steps.append(f"{indent}Then status <expectedStatus>")
         
         # Response validation based on scenario type and status
-        if scenario.scenario_type == ScenarioType.POSITIVE:
+        if scenario.scenario_type is _POSITIVE_TYPE:
             # Positive scenarios: validate successful response structure
             steps.extend(self._build_success_validation_steps(indent))
         elif not is_header_validation:
@@ -217,66 +213,53 @@ class KarateFeatureBuilder:
     
     def _is_header_validation_scenario(self, scenario: KarateScenario) -> bool:
         """Check if scenario validates header requirements."""
-        from ..domain.value_objects import HeaderExtractor
-        
         # Check if test names contain header validation keywords
         if not scenario.examples:
             return False
         
-        sample_name = scenario.examples[0].test_name
-        detected_headers = HeaderExtractor.detect_header_hints_in_text(sample_name)
-        return len(detected_headers) > 0
+        return bool(HeaderExtractor.detect_header_hints_in_text(scenario.examples[0].test_name))
     
-    def _build_examples_table(self, examples: List[KarateExample]) -> List[str]:
-        """Build examples table with proper alignment, excluding unnecessary columns."""
+    def _build_examples_table(self, examples: List[KarateExample], buf: io.StringIO) -> None:
+        """Write examples table with proper alignment, excluding unnecessary columns."""
         if not examples:
-            return []
+            return
         
-        # Get all unique column names from all examples
-        all_columns = set()
-        for example in examples:
-            row = example.to_table_row()
-            all_columns.update(row.keys())
+        # Convert every example once; headers are filtered for the whole batch
+        table_rows = KarateExample.to_table_rows(examples)
         
-        # Filter columns: keep only those with at least one non-empty value
+        # Single pass: stringify every cell once, track the widest value per
+        # column and which columns have at least one non-empty value
+        str_rows = []
+        value_widths: Dict[str, int] = {}
         columns_with_values = set()
-        for col in all_columns:
-            for example in examples:
-                row = example.to_table_row()
-                value = str(row.get(col, "")).strip()
-                if value:  # Column has at least one non-empty value
+        for row in table_rows:
+            # Most cells are already strings: only stringify the others
+            str_row = {col: value if type(value) is str else str(value) for col, value in row.items()}
+            for col, value in str_row.items():
+                if len(value) > value_widths.get(col, 0):
+                    value_widths[col] = len(value)
+                if col not in columns_with_values and value.strip():
                     columns_with_values.add(col)
-                    break
+            str_rows.append(str_row)
         
         # Order columns: standard fields first, then test data
         standard_fields = self._get_standard_column_order(columns_with_values)
         columns = [col for col in standard_fields if col in columns_with_values]
         
-        # Add remaining columns in sorted order
-        remaining_cols = sorted(columns_with_values - set(columns))
-        columns.extend(remaining_cols)
-        
-        # Calculate column widths
-        col_widths = {col: len(col) for col in columns}
-        for example in examples:
-            row = example.to_table_row()
-            for col in columns:
-                value = str(row.get(col, ""))
-                col_widths[col] = max(col_widths[col], len(value))
-        
-        # Build header row
-        header_cells = [col.ljust(col_widths[col]) for col in columns]
-        header = f"{self.indent}  | {' | '.join(header_cells)} |"
-        
-        # Build data rows
-        rows = [header]
-        for example in examples:
-            row_data = example.to_table_row()
-            cells = [str(row_data.get(col, "")).ljust(col_widths[col]) for col in columns]
-            row = f"{self.indent}  | {' | '.join(cells)} |"
-            rows.append(row)
-        
-        return rows
+        # Add remaining columns in sorted order (difference() takes the list directly, no temp set)
+        columns.extend(sorted(columns_with_values.difference(columns)))
+        
+        # Column widths: widest of the header and its values
+        col_widths = {col: max(len(col), value_widths.get(col, 0)) for col in columns}
+        
+        # Row template with every column left-aligned to its width, built once per table
+        row_format = f"\n{self.indent}  | " + " | ".join(f"{{:<{col_widths[col]}}}" for col in columns) + " |"
+        
+        # Write header row, then data rows; map() pulls each row's cells in column
+        # order (blank when missing) without a per-row list comprehension
+        buf.write(row_format.format(*columns))
+        blanks = ("",) * len(columns)
+        buf.writelines(row_format.format(*map(str_row.get, columns, blanks)) for str_row in str_rows)
     
     def _get_standard_column_order(self, all_columns: Set[str]) -> List[str]:
         """
@@ -308,8 +291,7 @@ class KarateFeatureBuilder:
     
     def _extract_path_params(self, endpoint: str) -> List[str]:
         """Extract path parameter names from endpoint."""
-        import re
-        return re.findall(r'\{([^}]+)\}', endpoint)
+        return _PATH_PARAM_RE.findall(endpoint)
     
     def _build_dynamic_path(self, endpoint: str) -> str:
         """Build dynamic path string for Karate.
@@ -317,10 +299,8 @@ class KarateFeatureBuilder:
         Converts: /polizas/{numeroPoliza}/descargar
         To: '/polizas', numeroPoliza, '/descargar'
         """
-        import re
-        
         # Split by path parameters
-        parts = re.split(r'(\{[^}]+\})', endpoint)
+        parts = _PATH_SPLIT_RE.split(endpoint)
         
         path_elements = []
         for part in parts:
@@ -347,13 +327,6 @@ class KarateFeatureBuilder:
         headers = HeaderExtractor.extract_headers_from_test_data(first_example.test_data)
         return headers
     
-    def _to_camel_case(self, header_name: str) -> str:
-        """Convert header name to camelCase for variable naming."""
-        # x-correlation-id -> xCorrelationId
-        # x-request-id -> xRequestId
-        parts = header_name.split('-')
-        return parts[0] + ''.join(word.capitalize() for word in parts[1:])
-    
     def _build_success_validation_steps(self, indent: str) -> List[str]:
         """Build validation steps for successful responses."""
         return [
@@ -381,18 +354,4 @@ class KarateFeatureBuilder:
             elif status_code == 404:
                 steps.append(f"{indent}And match response.message == '#string'")
         
-        return steps
-    
-    def _group_scenarios_by_status(self, scenarios: List[KarateScenario]) -> Dict[int, List[KarateScenario]]:
-        """Group negative scenarios by HTTP status code."""
-        groups: Dict[int, List[KarateScenario]] = {}
-        
-        for scenario in scenarios:
-            # Get status from first example
-            if scenario.examples:
-                status = scenario.examples[0].expected_status
-                if status not in groups:
-                    groups[status] = []
-                groups[status].append(scenario)
-        
-        return groups
\ No newline at end of file
+        return steps
\ No newline at end of file
@@ -2,8 +2,10 @@
 Implementation of Karate generation repositories.
 """
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set, TextIO, Optional, Tuple
 from datetime import datetime
 
 from ..domain.repositories import KarateGeneratorRepository
@@ -17,24 +19,99 @@ from ..config import PATH_CONFIG
 from .feature_builder import KarateFeatureBuilder
 
 
+# Below this many candidate files, a thread pool costs more than it saves
+_PARALLEL_SCAN_THRESHOLD = 8
+
+
+def _may_be_test_case_file(raw: bytes) -> bool:
+    """Byte-level prefilter: True unless the raw JSON cannot contain the test case keys."""
+    if b'"test_cases"' in raw and b'"endpoint"' in raw:
+        return True
+    return b'"metadata"' in raw and (b'"success_test_cases"' in raw or b'"failure_test_cases"' in raw)
+
+
+def _read_test_case_file(file_path: Path) -> Optional[Any]:
+    """Parse a JSON file if it holds test cases in the old or new format, else return None."""
+    try:
+        raw = file_path.read_bytes()
+        # Cheap byte sniff first: files missing the required keys are skipped without parsing
+        if not _may_be_test_case_file(raw):
+            return None
+        
+        data = json.loads(raw.decode("utf-8"))
+        
+        # Check for both old and new format
+        has_old_format = "test_cases" in data and "endpoint" in data
+        has_new_format = "metadata" in data and ("success_test_cases" in data or "failure_test_cases" in data)
+        
+        return data if has_old_format or has_new_format else None
+    except (json.JSONDecodeError, IOError):
+        # Skip invalid files
+        return None
+
+
 class FileKarateRepository(KarateGeneratorRepository):
     """File-based implementation of KarateGeneratorRepository."""
     
     def __init__(self):
         self.feature_builder = KarateFeatureBuilder()
         self.path_config = PATH_CONFIG
+        # Directories already created by this repository, so batch saves skip repeated mkdir calls
+        self._created_dirs: Set[Path] = set()
+        # Test case files parsed by list_test_case_files during the current generation run,
+        # keyed by path with the (mtime_ns, size) they were read at; emptied by clear_test_case_cache
+        self._parsed_files: Dict[str, Tuple[int, int, Any]] = {}
+    
+    def prepare_output_dirs(self, output_dir: Path) -> None:
+        """Create the resources and features directories up front for a batch of saves."""
+        for directory in (output_dir / "resources", output_dir / self.path_config.FEATURES_DIR):
+            # Always hit the filesystem here: the tree may have been removed since the last batch
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+    
+    def clear_test_case_cache(self) -> None:
+        """Drop the test case files parsed during the current generation run."""
+        self._parsed_files.clear()
+    
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create directory (and parents) unless this repository already created it."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+    
+    def _open_for_write(self, file_path: Path) -> TextIO:
+        """Open file_path for writing, recreating its directory if it was removed since it was cached."""
+        try:
+            return open(file_path, "w", encoding="utf-8")
+        except FileNotFoundError:
+            self._created_dirs.discard(file_path.parent)
+            self._ensure_dir(file_path.parent)
+            return open(file_path, "w", encoding="utf-8")
+    
+    def _write_text(self, file_path: Path, content: str) -> None:
+        """Write content to file_path."""
+        with self._open_for_write(file_path) as f:
+            f.write(content)
     
     def load_test_cases(self, file_path: Path) -> Dict[str, Any]:
         """Load test cases from JSON file."""
         try:
-            if not file_path.exists():
+            # One stat both checks existence and validates the run's parsed copy
+            try:
+                stat = file_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 raise InvalidTestCaseFileError(f"File not found: {file_path}")
             
             if not file_path.suffix == ".json":
                 raise InvalidTestCaseFileError(f"Invalid file type: {file_path.suffix}. Expected .json")
             
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Reuse the parse from list_test_case_files when the file is unchanged since it was listed.
+            # The parsed document is shared by every load in the run, so callers must only read it.
+            cached = self._parsed_files.get(str(file_path))
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                data = cached[2]
+            else:
+                data = json.loads(file_path.read_text(encoding="utf-8"))
             
             # Check if data has metadata structure (new format)
             if "metadata" in data:
@@ -75,17 +152,16 @@ class FileKarateRepository(KarateGeneratorRepository):
             # Create feature directory: output_dir/resources/features/
             features_path = self.path_config.FEATURES_DIR
             feature_dir = output_dir / features_path
-            feature_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(feature_dir)
             
             # Generate file path
             file_path = feature_dir / feature.get_file_name()
             
-            # Build feature content
+            # Build feature content before opening the file, so a failed render keeps the old feature
             content = self.feature_builder.build(feature)
             
             # Write to file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            self._write_text(file_path, content)
             
             return file_path
         
@@ -97,13 +173,12 @@ class FileKarateRepository(KarateGeneratorRepository):
         try:
             # Create resources directory: output_dir/resources/
             resources_dir = output_dir / "resources"
-            resources_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(resources_dir)
             
             config_path = resources_dir / "karate-config.js"
             content = config.generate_config_content()
             
-            with open(config_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            self._write_text(config_path, content)
             
             return config_path
         
@@ -115,24 +190,26 @@ class FileKarateRepository(KarateGeneratorRepository):
         if not directory.exists():
             return []
         
-        # Find all JSON files in the directory
-        json_files = list(directory.glob("*.json"))
+        # Find all JSON files in the directory; scandir's cached d_type avoids a stat per entry
+        # for the filter, and the stat taken here is recorded with the parsed data
+        with os.scandir(directory) as entries:
+            json_files = [(entry.path, entry.stat()) for entry in entries
+                          if entry.name.endswith(".json") and entry.is_file()]
+        paths = [Path(path) for path, _ in json_files]
         
-        # Filter to only test case files
+        # Filter to only test case files; reads are I/O bound, so larger directories use a thread pool
+        if len(json_files) < _PARALLEL_SCAN_THRESHOLD:
+            parsed = list(map(_read_test_case_file, paths))
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as executor:
+                parsed = list(executor.map(_read_test_case_file, paths))
+        
+        # Keep the parsed test case files for load_test_cases in this generation run
         test_case_files = []
-        for file_path in json_files:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Check for both old and new format
-                    has_old_format = "test_cases" in data and "endpoint" in data
-                    has_new_format = "metadata" in data and ("success_test_cases" in data or "failure_test_cases" in data)
-                    
-                    if has_old_format or has_new_format:
-                        test_case_files.append(file_path)
-            except (json.JSONDecodeError, IOError):
-                # Skip invalid files
-                continue
+        for (path, stat), file_path, data in zip(json_files, paths, parsed):
+            if data is not None:
+                self._parsed_files[path] = (stat.st_mtime_ns, stat.st_size, data)
+                test_case_files.append(file_path)
         
         return sorted(test_case_files)
     
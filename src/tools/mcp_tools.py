@@ -1,5 +1,7 @@
 """MCP tools orchestrator for Swagger Analysis and Test Generation."""
+import asyncio
 import logging
+from functools import cached_property
 from typing import Dict, Any
 from pathlib import Path
 
@@ -13,21 +15,13 @@ logger = logging.getLogger(__name__)
 # Import swagger analysis services
 from src.tools.swagger_analysis.application.services import SwaggerAnalysisService
 from src.tools.swagger_analysis.infrastructure.repositories import HttpSwaggerRepository
+from src.tools.swagger_analysis.infrastructure.cache import SpecificationCache
 from src.tools.swagger_analysis.domain.exceptions import SwaggerAnalysisError
 from src.shared.mappers.swagger_mapper import SwaggerMapper
 
-# Import test generation services
-from src.tools.test_generation.application.equivalence_partitioning.services import EquivalencePartitionService
-from src.tools.test_generation.application.boundary_value_analysis.services import BVAService
-from src.tools.test_generation.application.unified_service import UnifiedTestGenerationService
-from src.tools.test_generation.domain.exceptions import TestGenerationError
-from src.tools.test_generation.domain.boundary_value_analysis.exceptions import BVAError
-from src.shared.mappers.test_case_mapper import TestCaseMapper
-
-# Import karate generation services
-from src.tools.karate_generation.application.services import KarateGenerationService
-from src.tools.karate_generation.infrastructure.repositories import FileKarateRepository
-from src.tools.karate_generation.domain.exceptions import KarateGenerationError
+# Test generation and karate generation modules are imported where they are used
+# (service properties and tool methods), so importing the orchestrator only pays
+# for the swagger analysis stack
 
 
 class MCPToolsOrchestrator:
@@ -43,21 +37,51 @@ class MCPToolsOrchestrator:
         # Initialize swagger analysis
         self.swagger_repo = HttpSwaggerRepository()
         self.swagger_service = SwaggerAnalysisService(self.swagger_repo)
+        # Serialized analyses per swagger URL, with the same TTL/enable settings as the spec cache
+        self._analysis_cache = SpecificationCache()
         
-        # Initialize test generation (SOLID: Dependency Injection)
-        self.test_generation_service = EquivalencePartitionService()
-        self.bva_service = BVAService()
+        # Karate generation configures process-wide header filtering, so runs must not overlap
+        self._karate_lock = asyncio.Lock()
+    
+    @cached_property
+    def test_generation_service(self):
+        """Equivalence Partitioning service, built on first use."""
+        from src.tools.test_generation.application.equivalence_partitioning.services import EquivalencePartitionService
+        return EquivalencePartitionService()
+    
+    @cached_property
+    def bva_service(self):
+        """Boundary Value Analysis service, built on first use."""
+        from src.tools.test_generation.application.boundary_value_analysis.services import BVAService
+        return BVAService()
+    
+    @cached_property
+    def dt_service(self):
+        """Decision Table service, built on first use."""
         from src.tools.test_generation.application.decision_table.services import DecisionTableService
-        self.dt_service = DecisionTableService()
-        self.unified_service = UnifiedTestGenerationService(
+        return DecisionTableService()
+    
+    @cached_property
+    def unified_service(self):
+        """Unified multi-technique service sharing the orchestrator's technique services."""
+        from src.tools.test_generation.application.unified_service import UnifiedTestGenerationService
+        return UnifiedTestGenerationService(
             ep_service=self.test_generation_service,
             bva_service=self.bva_service,
             dt_service=self.dt_service
         )
-        
-        # Initialize karate generation
-        self.karate_repo = FileKarateRepository()
-        self.karate_service = KarateGenerationService(self.karate_repo)
+    
+    @cached_property
+    def karate_repo(self):
+        """Karate feature repository, built on first use."""
+        from src.tools.karate_generation.infrastructure.repositories import FileKarateRepository
+        return FileKarateRepository()
+    
+    @cached_property
+    def karate_service(self):
+        """Karate generation service, built on first use."""
+        from src.tools.karate_generation.application.services import KarateGenerationService
+        return KarateGenerationService(self.karate_repo)
     
     async def analyze_swagger_from_url(
         self, 
@@ -77,21 +101,26 @@ class MCPToolsOrchestrator:
             Comprehensive swagger analysis result with detailed validation info
         """
         try:
-            # Use swagger analysis service
-            result = await self.swagger_service.analyze_swagger(swagger_url)
-            
-            # Convert using the new mapper
-            result_dict = SwaggerMapper.to_dict(result)
+            # Repeated calls for the same URL reuse the already-mapped analysis
+            result_dict = self._analysis_cache.get(swagger_url)
+            if result_dict is None:
+                # Use swagger analysis service
+                result = await self.swagger_service.analyze_swagger(swagger_url)
+                
+                # Convert using the new mapper
+                result_dict = SwaggerMapper.to_dict(result)
+                self._analysis_cache.set(swagger_url, result_dict)
             
             response = {
                 "success": True,
                 "data": result_dict,
-                "message": f"Successfully analyzed {result.total_endpoints} endpoints from swagger specification"
+                "message": f"Successfully analyzed {result_dict['total_endpoints']} endpoints from swagger specification"
             }
             
             # Save to file if requested
             if save_output and output_format in ["file", "both"]:
-                file_path = SwaggerMapper.save_to_json(result_dict, swagger_url)
+                # Blocking file write runs in a worker thread to keep the event loop free
+                file_path = await asyncio.to_thread(SwaggerMapper.save_to_json, result_dict, swagger_url)
                 response["output_file"] = str(file_path)
                 response["message"] += f" | Output saved to: {file_path}"
             
@@ -134,6 +163,9 @@ class MCPToolsOrchestrator:
         Returns:
             Test generation results with all test cases and coverage metrics
         """
+        from src.tools.test_generation.domain.exceptions import TestGenerationError
+        from src.shared.mappers.test_case_mapper import TestCaseMapper
+        
         try:
             # Generate test cases
             results = await self.test_generation_service.generate_test_cases_from_json(
@@ -158,7 +190,10 @@ class MCPToolsOrchestrator:
             
             # Save to files if requested (one per endpoint)
             if save_output:
-                file_paths = TestCaseMapper.save_to_json(results, swagger_analysis_file)
+                # Blocking file writes run in a worker thread to keep the event loop free
+                file_paths = await asyncio.to_thread(
+                    TestCaseMapper.save_to_json, results, swagger_analysis_file
+                )
                 response["output_files"] = [str(fp) for fp in file_paths]
                 response["message"] += f" | Output saved to {len(file_paths)} files"
             
@@ -203,6 +238,8 @@ class MCPToolsOrchestrator:
         Returns:
             Generation results with feature file paths and summary
         """
+        from src.tools.karate_generation.domain.exceptions import KarateGenerationError
+        
         try:
             # Setup paths
             test_cases_dir = Path(test_cases_directory)
@@ -220,12 +257,14 @@ class MCPToolsOrchestrator:
             else:
                 output_dir = Path(output_directory)
             
-            # Generate features
-            result = self.karate_service.generate_features_from_directory(
-                test_cases_dir=test_cases_dir,
-                output_dir=output_dir,
-                base_url=base_url
-            )
+            # Generate features in a worker thread (file I/O and rendering would block the event loop)
+            async with self._karate_lock:
+                result = await asyncio.to_thread(
+                    self.karate_service.generate_features_from_directory,
+                    test_cases_dir=test_cases_dir,
+                    output_dir=output_dir,
+                    base_url=base_url
+                )
             
             if result.success:
                 response = {
@@ -294,6 +333,9 @@ class MCPToolsOrchestrator:
         Returns:
             Unified test generation results with all techniques applied
         """
+        from src.tools.test_generation.domain.exceptions import TestGenerationError
+        from src.shared.mappers.test_case_mapper import TestCaseMapper
+        
         try:
             # Default to both techniques if not specified
             if techniques is None:
@@ -377,6 +419,8 @@ class MCPToolsOrchestrator:
         Returns:
             BVA test generation results with coverage metrics
         """
+        from src.tools.test_generation.domain.boundary_value_analysis.exceptions import BVAError
+        
         try:
             # Generate BVA test cases
             results = await self.bva_service.generate_bva_tests(
@@ -402,7 +446,7 @@ class MCPToolsOrchestrator:
             
             # Save to files if requested
             if save_output:
-                file_paths = self._save_bva_results(results, swagger_analysis_file)
+                file_paths = await self._save_bva_results(results, swagger_analysis_file)
                 response["output_files"] = [str(fp) for fp in file_paths]
                 response["message"] += f" | Output saved to {len(file_paths)} files"
             
@@ -445,20 +489,27 @@ class MCPToolsOrchestrator:
             } for tc in r.test_cases]
         } for r in results]
     
-    def _save_bva_results(self, results: list, swagger_file: str) -> list:
-        """Save BVA results to JSON files."""
+    async def _save_bva_results(self, results: list, swagger_file: str) -> list:
+        """Save BVA results to JSON files, writing the per-endpoint files concurrently."""
         from datetime import datetime
         
         swagger_path = Path(swagger_file)
         # Use configuration for output directory
         output_dir = self.config.output.get_bva_output_path()
         
-        file_paths = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        pending = []
+        # One clock read per batch: shared by every filename and metadata block
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        generated_at = now.isoformat()
+        
+        # All results go to the same directory: create it once for the batch
+        if results:
+            await asyncio.to_thread(FileOperations.ensure_directory, output_dir)
         
         for result in results:
             # Generate filename
-            endpoint_name = result.endpoint.replace("/", "_").replace("{", "").replace("}", "")
+            endpoint_name = result.endpoint.translate(FileOperations.ENDPOINT_FILENAME_TABLE)
             if endpoint_name.startswith("_"):
                 endpoint_name = endpoint_name[1:]
             
@@ -473,7 +524,8 @@ class MCPToolsOrchestrator:
                 additional_fields={
                     "endpoint": result.endpoint,
                     "http_method": result.http_method
-                }
+                },
+                generated_at=generated_at
             )
             
             # Prepare output data
@@ -498,8 +550,11 @@ class MCPToolsOrchestrator:
                 } for tc in result.test_cases]
             }
             
-            # Use FileOperations to save JSON
-            FileOperations.save_json(output_data, file_path)
-            file_paths.append(file_path)
+            pending.append((output_data, file_path))
         
-        return file_paths
\ No newline at end of file
+        # Each endpoint has its own file: dispatch the blocking writes to worker threads
+        # together so the batch takes about as long as the slowest write
+        return list(await asyncio.gather(*(
+            asyncio.to_thread(FileOperations.save_json, data, path, ensure_parent=False)
+            for data, path in pending
+        )))
\ No newline at end of file
@@ -1,4 +1,5 @@
 """Refactored HTTP Swagger Repository using specialized services."""
+import asyncio
 from typing import Dict, Any, List
 
 from ..domain.repositories import SwaggerRepository
@@ -40,6 +41,8 @@ class HttpSwaggerRepository(SwaggerRepository):
         
         # Resolver is initialized per-spec since it needs the full spec
         self.resolver: SchemaResolver = None
+        # Parsing runs in a worker thread; the lock keeps one spec per resolver at a time
+        self._parse_lock = asyncio.Lock()
     
     async def fetch_swagger_spec(self, url: str) -> Dict[str, Any]:
         """
@@ -68,6 +71,22 @@ class HttpSwaggerRepository(SwaggerRepository):
         """
         Parse swagger specification into analysis result.
         
+        Args:
+            spec: Swagger specification dictionary
+            
+        Returns:
+            SwaggerAnalysisResult with complete analysis
+        """
+        # $ref resolution needs the whole document, so the spec cannot be parsed
+        # incrementally; instead the CPU-bound walk leaves the event loop so other
+        # fetches keep progressing while this one is analyzed
+        async with self._parse_lock:
+            return await asyncio.to_thread(self._parse_spec, spec)
+    
+    def _parse_spec(self, spec: Dict[str, Any]) -> SwaggerAnalysisResult:
+        """
+        Build the analysis result for a fully fetched specification.
+        
         Args:
             spec: Swagger specification dictionary
             
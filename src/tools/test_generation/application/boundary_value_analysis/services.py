@@ -2,6 +2,7 @@
 Service for generating BVA test cases from Swagger analysis.
 Follows ISTQB v4 definition of Boundary Value Analysis.
 """
+import asyncio
 import json
 from typing import List, Dict, Any
 from pathlib import Path
@@ -38,9 +39,8 @@ class BVAService:
             List of BVAResult objects
         """
         try:
-            # Load swagger analysis
-            with open(swagger_analysis_file, 'r', encoding='utf-8') as f:
-                swagger_data = json.load(f)
+            # Load swagger analysis (blocking read runs in a worker thread)
+            swagger_data = await asyncio.to_thread(self._load_swagger_analysis, swagger_analysis_file)
             
             # Convert string to enum
             bva_version_enum = BVAVersion.TWO_VALUE if bva_version == "2-value" else BVAVersion.THREE_VALUE
@@ -68,6 +68,11 @@ class BVAService:
         except Exception as e:
             raise BVAError(f"Error generating BVA tests: {str(e)}")
     
+    def _load_swagger_analysis(self, file_path: str) -> Dict[str, Any]:
+        """Load swagger analysis from JSON file."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
     def _generate_for_endpoint(
         self,
         endpoint_data: Dict[str, Any],
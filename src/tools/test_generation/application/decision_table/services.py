@@ -11,6 +11,7 @@ Responsibilities:
 - Build test cases from rules
 - Calculate coverage metrics
 """
+import asyncio
 import json
 import logging
 from typing import List, Dict, Any, Optional
@@ -78,7 +79,7 @@ class DecisionTableService:
         """
         try:
             # Load Swagger analysis
-            swagger_data = self._load_swagger_analysis(swagger_analysis_file)
+            swagger_data = await asyncio.to_thread(self._load_swagger_analysis, swagger_analysis_file)
             
             # Generate test cases for each endpoint
             results = []
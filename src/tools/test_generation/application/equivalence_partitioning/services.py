@@ -1,4 +1,5 @@
 """Application service for Equivalence Partitioning technique (ISTQB v4)."""
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -75,7 +76,7 @@ class EquivalencePartitionService:
         
         try:
             # Load swagger analysis
-            swagger_analysis = self._load_swagger_analysis(swagger_analysis_file)
+            swagger_analysis = await asyncio.to_thread(self._load_swagger_analysis, swagger_analysis_file)
             
             # Generate test cases
             return await self.generate_test_cases_from_analysis(
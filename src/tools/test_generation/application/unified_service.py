@@ -7,6 +7,7 @@ Respects DIP: Depends on abstractions (repositories), not concrete implementatio
 
 from typing import List, Dict, Any
 from pathlib import Path
+import asyncio
 import json
 
 from ..domain.models import UnifiedTestResult
@@ -159,7 +160,10 @@ class UnifiedTestGenerationService:
         # Save unified results if requested
         if save_output:
             from src.shared.mappers.test_case_mapper import TestCaseMapper
-            TestCaseMapper.save_unified_to_json(unified_results, swagger_analysis_file)
+            # Blocking file writes run in a worker thread to keep the event loop free
+            await asyncio.to_thread(
+                TestCaseMapper.save_unified_to_json, unified_results, swagger_analysis_file
+            )
         
         return unified_results
     